@@ -88,7 +88,7 @@ class EngineerEvents(commands.Cog):
         """Evaluate triggers for every registered player every N seconds."""
         vm: VoiceManager = self.bot.voice_manager
 
-        for car_idx, ps in game_state.players.items():
+        for ps in game_state.active_players():
             events = self.logic.evaluate(ps)
             for event in events:
                 try:
@@ -141,7 +141,7 @@ class EngineerEvents(commands.Cog):
         import time
         if not TELEMETRY_LOST_WARN:
             return
-        now = time.time()
+        now = time.monotonic()   # last_packet_time is stamped on the monotonic clock
         elapsed = now - game_state.last_packet_time
         if elapsed > 30:
             # Post only once per disconnect, or at most every COOLDOWN seconds
@@ -171,7 +171,7 @@ class EngineerEvents(commands.Cog):
 
     async def on_chequered_flag(self) -> None:
         """Called when F1 25 sends a chequered flag event."""
-        for car_idx, ps in game_state.players.items():
+        for ps in game_state.active_players():
             event = self.logic.on_chequered_flag(ps)
             if event:
                 message_text = await generate_radio_message(event)
@@ -187,7 +187,7 @@ class EngineerEvents(commands.Cog):
             colour=discord.Colour.gold(),
         )
 
-        for car_idx, ps in game_state.players.items():
+        for ps in game_state.active_players():
             if not ps.discord_id:
                 continue
             laps = await get_session_laps(ps.discord_id, ps.track_name, str(date.today()))
@@ -142,6 +142,7 @@ class VoiceManager:
 
                 # Re-connect if needed
                 if not await self.ensure_connected():
+                    cleanup_audio(file_path)
                     await asyncio.sleep(self.RECONNECT_DELAY)
                     self._queue.task_done()
                     continue
@@ -745,10 +745,10 @@ class EngineerLogic:
     def _get_car_at_position(self, target_pos: int):
         """
         Return the CarSnapshot of whichever car is currently at `target_pos`.
-        O(20) scan of all_cars — fine for F1's fixed 20-car field.
-        Returns None if target_pos not found or all_cars is empty.
+        O(22) scan of all_cars — fine for F1's fixed-size field.
+        Returns None if target_pos not found (cars yet to report sit at position 0).
         """
-        for snap in _gs.all_cars.values():
+        for snap in _gs.all_cars:
             if snap.position == target_pos:
                 return snap
         return None
@@ -762,12 +762,12 @@ class EngineerLogic:
           - summary string for the LLM (e.g. 'P4: +5.2s | P5(you) | P6: +1.1s behind')
         """
         my_pos = ps.current_position
-        if my_pos == 0 or not _gs.all_cars:
+        if my_pos == 0:
             return {}
 
         # Sort all cars by position
         sorted_cars = sorted(
-            (s for s in _gs.all_cars.values() if s.position > 0),
+            (s for s in _gs.all_cars if s.position > 0),
             key=lambda s: s.position
         )
         if not sorted_cars:
@@ -829,7 +829,7 @@ class EngineerLogic:
             "fuel_remaining_laps": round(ps.fuel_remaining_laps, 1),
             "fuel_kg":           round(ps.fuel_remaining, 2),
             "fuel_mix":          _FUEL_MIX.get(ps.fuel_mix, "standard"),
-            "ers_pct":           round(ps.ers_pct, 1),
+            "ers_pct":           round(ps.ers_percent, 1),
             "ers_mode":          _ERS_MODE.get(ps.ers_deploy_mode, "none"),
             "gap_to_ahead":      round(ps.gap_to_ahead, 3),
             "gap_to_behind":     round(ps.gap_to_behind, 3),
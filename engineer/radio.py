@@ -360,7 +360,7 @@ async def generate_radio_message(event: RadioEvent) -> str:
     # Build the trigger-specific user prompt
     template = _TRIGGER_PROMPTS.get(trigger, "Report on the current race situation.")
     try:
-        prompt = template.format(**context)
+        prompt = template.format(**{k: _format_value(v) for k, v in context.items()})
     except KeyError:
         prompt = template  # Some contexts may not have all vars
 
@@ -392,6 +392,13 @@ async def generate_radio_message(event: RadioEvent) -> str:
 
 
 
+def _format_value(v: object) -> object:
+    """Render sequences (e.g. upcoming_corners) as plain comma-separated text."""
+    if isinstance(v, (list, tuple)):
+        return ", ".join(map(str, v)) or "none"
+    return v
+
+
 def _format_context(ctx: dict) -> str:
     """Pretty-print the race state context for the LLM."""
     lines = []
@@ -399,7 +406,7 @@ def _format_context(ctx: dict) -> str:
         if isinstance(v, dict):
             lines.append(f"  {k}:")
             for sk, sv in v.items():
-                lines.append(f"    {sk}: {sv}")
+                lines.append(f"    {sk}: {_format_value(sv)}")
         else:
-            lines.append(f"  {k}: {v}")
+            lines.append(f"  {k}: {_format_value(v)}")
     return "\n".join(lines)
@@ -11,21 +11,24 @@ Sector boundaries are also expressed as fractions.
 """
 
 from __future__ import annotations
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Data structures
 # ──────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Corner:
     frac: float   # 0.0–1.0 lap fraction
     name: str     # e.g. "T1 (Copse)" or "T8–9 (Maggotts-Becketts-Chapel)"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrackInfo:
     full_name:        str
     s1_end:           float       # fraction where Sector 1 ends
@@ -36,6 +39,85 @@ class TrackInfo:
     traction_zones:   str = ""    # traction-critical exits
     notes:            str = ""    # 1-2 sentence engineer briefing for LLM
 
+    # Derived at construction: corners split into parallel fraction/name tuples
+    # so the per-tick position lookup never touches Corner objects.
+    corner_fracs:     tuple[float, ...] = field(init=False, repr=False, default=())
+    corner_names:     tuple[str, ...]   = field(init=False, repr=False, default=())
+    drs_joined:       str = field(init=False, repr=False, default="")
+
+    def __post_init__(self) -> None:
+        # Frozen instance — derived fields have to bypass the generated __setattr__.
+        # Multi-word strings aren't auto-interned; interning dedupes repeated
+        # names ("T1", "Main straight") across tracks and makes compares cheap.
+        for name in ("overtaking_spots", "traction_zones", "notes"):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+        object.__setattr__(self, "corner_fracs", tuple(c.frac for c in self.corners))
+        object.__setattr__(self, "corner_names", tuple(sys.intern(c.name) for c in self.corners))
+        object.__setattr__(self, "drs_joined",   sys.intern(", ".join(self.drs_zones)))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Position core
+# ──────────────────────────────────────────────────────────────────────────────
+
+# Lap fraction resolution of the per-track corner lookup tables
+_LAP_GRID = 256
+
+
+def _sector(info: TrackInfo, frac: float) -> int:
+    """Sector (1–3) for a clamped lap fraction."""
+    # Branchless: s1_end < s2_end, so each boundary crossed adds one
+    return 1 + (frac > info.s1_end) + (frac > info.s2_end)
+
+
+def _compute_position(
+    fracs: tuple[float, ...], lap_frac: float,
+) -> tuple[int, int, int]:
+    """
+    Exact corner lookup for one lap fraction — no strings, no dicts.
+    Sampled by _build_corner_tables to fill the per-track lookup tables.
+
+    Returns (nearest_idx, upcoming_start, upcoming_end) where nearest_idx is
+    the last corner at or just before the car (-1 when no corner has been
+    passed yet, which wraps to the final corner) and
+    fracs[upcoming_start:upcoming_end] are the corners in the next 30% of lap.
+    """
+    # Clamp fraction to valid range
+    frac = max(0.0, min(1.0, lap_frac))
+
+    # Small lookahead so "at the corner" counts as passed
+    nearest_idx = bisect_right(fracs, frac + 0.01) - 1
+    return (
+        nearest_idx,
+        bisect_right(fracs, frac),
+        bisect_right(fracs, frac + 0.30),
+    )
+
+
+def _build_corner_tables(
+    info: TrackInfo,
+) -> tuple[tuple[Optional[str], ...], tuple[tuple[str, ...], ...]]:
+    """
+    Precompute nearest / upcoming corners for every 1/_LAP_GRID step of the lap.
+
+    Both answers are step functions of the lap fraction, so sampling them once
+    turns the per-tick corner lookup into two tuple indexes. Identical
+    upcoming runs share one tuple. Built on first use per track — see
+    _corner_tables().
+    """
+    fracs, names = info.corner_fracs, info.corner_names
+    slices: dict[tuple[int, int], tuple[str, ...]] = {}
+    nearest_table:  list[Optional[str]]   = []
+    upcoming_table: list[tuple[str, ...]] = []
+    for q in range(_LAP_GRID):
+        nearest_idx, up_start, up_end = _compute_position(fracs, q / _LAP_GRID)
+        nearest_table.append(names[nearest_idx] if names else None)
+        key = (up_start, up_end)
+        if key not in slices:
+            slices[key] = names[up_start:up_end]
+        upcoming_table.append(slices[key])
+    return tuple(nearest_table), tuple(upcoming_table)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Track database — keyed by the track_name strings used in _TRACK_NAMES
@@ -456,16 +538,54 @@ TRACK_DB: dict[str, TrackInfo] = {
 }
 
 
+# Intern the keys so lookups with an interned PlayerState.track_name (the parser
+# interns it) hit on the identity check instead of a full string compare.
+TRACK_DB = {sys.intern(name): info for name, info in TRACK_DB.items()}
+
+# Returned as-is for tracks missing from TRACK_DB. Read-only and shared between
+# calls — callers merge it with dict.update() and must not mutate it.
+_EMPTY_CONTEXT: Mapping[str, object] = MappingProxyType({
+    "track_notes":      "",
+    "overtaking_spots": "",
+    "traction_zones":   "",
+    "drs_zones":        "",
+    "current_sector":   None,
+    "nearest_corner":   None,
+    "upcoming_corners": (),
+})
+
+# Key skeleton for track_context's output, in output order; copied per call.
+_OUTPUT_TEMPLATE: dict[str, object] = dict(_EMPTY_CONTEXT)
+
+# Per-track (nearest_table, upcoming_table), filled on first lookup so a session
+# only pays the table build for the circuit actually being driven.
+_CORNER_TABLES: dict[str, tuple[tuple[Optional[str], ...], tuple[tuple[str, ...], ...]]] = {}
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Public helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
 def get_track_info(track_name: str) -> Optional[TrackInfo]:
     """Return the TrackInfo for a given track name, or None if not in database."""
-    return TRACK_DB.get(track_name)
+    try:
+        return TRACK_DB[track_name]
+    except KeyError:
+        return None
+
+
+def _corner_tables(
+    track_name: str, info: TrackInfo,
+) -> tuple[tuple[Optional[str], ...], tuple[tuple[str, ...], ...]]:
+    """Return the corner lookup tables for a track, building them on first use."""
+    try:
+        return _CORNER_TABLES[track_name]
+    except KeyError:
+        tables = _CORNER_TABLES[track_name] = _build_corner_tables(info)
+        return tables
 
 
-def track_context(track_name: str, lap_frac: float) -> dict:
+def track_context(track_name: str, lap_frac: float) -> Mapping[str, object]:
     """
     Build a context dict describing the current track position and circuit facts.
 
@@ -473,52 +593,32 @@ def track_context(track_name: str, lap_frac: float) -> dict:
         track_name: from PlayerState.track_name (e.g. "Monza")
         lap_frac:   fraction of lap completed (m_lapDistance / track_length_m), 0.0–1.0
 
-    Returns a dict ready to merge into _build_context().
+    Returns a mapping ready to merge into _build_context(). Unknown tracks get
+    the shared read-only _EMPTY_CONTEXT, so treat the result as read-only;
+    upcoming_corners is a tuple.
     """
-    info = get_track_info(track_name)
-    if info is None:
-        return {
-            "track_notes":      "",
-            "overtaking_spots": "",
-            "traction_zones":   "",
-            "drs_zones":        "",
-            "current_sector":   None,
-            "nearest_corner":   None,
-            "upcoming_corners": [],
-        }
+    # Known tracks are the common case — one hash probe, no None check
+    try:
+        info = TRACK_DB[track_name]
+    except KeyError:
+        return _EMPTY_CONTEXT
 
     # Clamp fraction to valid range
     frac = max(0.0, min(1.0, lap_frac))
 
-    # Sector from fraction
-    if frac <= info.s1_end:
-        sector = 1
-    elif frac <= info.s2_end:
-        sector = 2
-    else:
-        sector = 3
-
-    # Nearest corner behind the car (last passed)
-    nearest = None
-    for c in reversed(info.corners):
-        if c.frac <= frac + 0.01:   # small lookahead so "at the corner" counts
-            nearest = c.name
-            break
-    if nearest is None and info.corners:
-        nearest = info.corners[-1].name   # past final corner, approaching S/F
-
-    # Upcoming corners in the next ~30% of lap
-    upcoming = [
-        c.name for c in info.corners
-        if frac < c.frac <= frac + 0.30
-    ]
-
-    return {
-        "track_notes":      info.notes,
-        "overtaking_spots": info.overtaking_spots,
-        "traction_zones":   info.traction_zones,
-        "drs_zones":        ", ".join(info.drs_zones),
-        "current_sector":   sector,
-        "nearest_corner":   nearest,
-        "upcoming_corners": upcoming,
-    }
+    # Copying the pre-sized template is cheaper than building a 7-key literal
+    out = _OUTPUT_TEMPLATE.copy()
+    out["track_notes"]      = info.notes
+    out["overtaking_spots"] = info.overtaking_spots
+    out["traction_zones"]   = info.traction_zones
+    out["drs_zones"]        = info.drs_joined
+    out["current_sector"]   = _sector(info, frac)
+
+    # Nearest corner behind the car and the corners in the next ~30% of lap,
+    # read from the precomputed tables (1/_LAP_GRID lap resolution).
+    # upcoming_corners is a shared tuple — never mutate it.
+    nearest_table, upcoming_table = _corner_tables(track_name, info)
+    q = min(int(frac * _LAP_GRID), _LAP_GRID - 1)
+    out["nearest_corner"]   = nearest_table[q]
+    out["upcoming_corners"] = upcoming_table[q]
+    return out
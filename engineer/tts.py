@@ -62,20 +62,32 @@ WHAT DOESN'T WORK IN V3:
 """
 
 from __future__ import annotations
+import hashlib
+import importlib.util
+import itertools
 import logging
 import os
 import re
 import tempfile
-import uuid
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import aiofiles
 from dotenv import load_dotenv
 
 load_dotenv()
 
 log = logging.getLogger("f1bot.tts")
 
+# ── HTTP client — we call the ElevenLabs REST endpoint directly ─────────────
+try:
+    import httpx
+except ImportError:
+    httpx = None
+    log.warning("httpx not found — TTS disabled. Install with: pip install httpx")
+
 _VOICE_ID    = os.getenv("ELEVENLABS_VOICE_ID", "")
 _API_KEY     = os.getenv("ELEVENLABS_API_KEY", "")
 
@@ -94,9 +106,30 @@ _STYLE            = float(os.getenv("TTS_STYLE",            "0.0"))
 _SPEAKER_BOOST    = os.getenv("TTS_SPEAKER_BOOST", "true").lower() in ("true", "1", "yes")
 _SPEED            = float(os.getenv("TTS_SPEED",            "0.90"))
 
+
+# Sent verbatim as the request's voice_settings object (fixed for the process)
+_VOICE_SETTINGS = {
+    "stability":         _STABILITY,
+    "similarity_boost":  _SIMILARITY_BOOST,
+    "style":             _STYLE,
+    "use_speaker_boost": _SPEAKER_BOOST,
+    "speed":             _SPEED,
+}
+
 # Temp directory for audio files
 _TEMP_DIR = Path(tempfile.gettempdir()) / "f1_engineer_bot"
 _TEMP_DIR.mkdir(exist_ok=True)
+# Per-process sequence for temp clip names (PID keeps concurrent bots apart)
+_FILE_COUNTER = itertools.count()
+
+# Disk-backed LRU of generated clips, keyed on prepared text + voice params.
+# Fallback lines ("Box box, tyres are done…") repeat verbatim all session;
+# a hit skips the ElevenLabs round-trip. 0 disables caching.
+_CACHE_SIZE = int(os.getenv("TTS_CACHE_SIZE", "200"))
+_AUDIO_CACHE: OrderedDict[str, Path] = OrderedDict()
+# Cache key → clips handed out and not yet released through cleanup_audio.
+# Eviction drops a pinned clip from the index but leaves the file for playback.
+_PINNED: dict[str, int] = {}
 
 
 # ─────────────────────────────────────────────────────────────
@@ -110,80 +143,105 @@ _ONES   = ["", "one", "two", "three", "four", "five", "six",
 _TENS   = ["", "", "twenty", "thirty", "forty", "fifty",
            "sixty", "seventy", "eighty", "ninety"]
 
+@lru_cache(maxsize=1024)
 def _int_to_words(n: int) -> str:
     """Convert integer 0-999 to English words."""
+    parts: list[str] = []
     if n < 0:
-        return "minus " + _int_to_words(-n)
+        parts.append("minus")
+        n = -n
+    if n >= 100:
+        parts.append(_ONES[n // 100])
+        parts.append("hundred")
+        n %= 100
+        if not n:
+            return " ".join(parts)
     if n < 20:
-        return _ONES[n]
-    if n < 100:
+        parts.append(_ONES[n])
+    else:
         t = _TENS[n // 10]
         o = _ONES[n % 10]
-        return t + ("-" + o if o else "")
-    else:
-        h = _ONES[n // 100] + " hundred"
-        remainder = n % 100
-        return h + (" " + _int_to_words(remainder) if remainder else "")
+        parts.append(t + "-" + o if o else t)
+    return " ".join(parts)
+
+
+# Pre-warm the hot values (positions, percentages, gaps) before the first call
+for _n in range(100):
+    _int_to_words(_n)
+del _n
+
+
+# Compiled once at import — the hot path calls .sub() directly and never goes
+# through re's pattern cache.
+#
+# All four number forms in one alternation so the text is scanned once.
+# Alternatives are tried in order at each position: percentages, float
+# seconds, positions, then plain integers.
+_RE_NUMBERS = re.compile(
+    r'\b(?P<pct>\d{1,3})%'                         # "83%"  → "eighty-three percent"
+    r'|\b(?P<secs>\d+\.\d+)s\b'                     # "1.8s" → "one point eight seconds"
+    r'|\bP(?P<pos>\d{1,2})\b'                       # "P3"   → "P three"
+    r'|(?<![A-Za-z])(?P<plain>\d{1,3})(?!\d|\.)'    # standalone integers
+)
+_RE_XML          = re.compile(r'<[^>]+>')
+# Cheap pre-screen: anything _prepare_text could rewrite contains a digit, a
+# tag opener or one of the _FIXES words.
+_NEEDS_WORK      = re.compile(r'[0-9<]|\b(?:V?SC|DRS|box box)\b', re.IGNORECASE)
+_RE_SENTENCE_END = re.compile(r'([.!?])\s+(?=\S)')
+
+
+def _number_words(m: re.Match) -> str:
+    """_RE_NUMBERS.sub callback — convert whichever number form matched."""
+    kind = m.lastgroup
+    value = m.group(kind)
+    try:
+        if kind == "plain":
+            return _int_to_words(int(value))
+        if kind == "pct":
+            return _int_to_words(int(value)) + " percent"
+        if kind == "pos":
+            # Keep the P prefix
+            return "P " + _int_to_words(int(value))
+        # "1.85s" → "one point eight five seconds", built in one join
+        whole, _, frac = value.partition(".")
+        dec = " ".join(_int_to_words(int(d)) for d in frac)
+        parts = [_int_to_words(int(whole))]
+        if dec:
+            parts += ("point", dec)
+        parts.append("seconds")
+        return " ".join(parts)
+    except Exception:
+        return m.group(0)
 
 
 def _normalise_numbers(text: str) -> str:
     """Replace bare digit numbers with their word equivalents."""
-    # Percentages: "83%" → "eighty-three percent"
-    def _pct(m):
-        try:
-            return _int_to_words(int(m.group(1))) + " percent"
-        except Exception:
-            return m.group(0)
-    text = re.sub(r'\b(\d{1,3})%', _pct, text)
+    return _RE_NUMBERS.sub(_number_words, text)
 
-    # Float seconds: "1.8s" → "one point eight seconds"
-    def _float_s(m):
-        try:
-            parts = m.group(1).split(".")
-            whole = _int_to_words(int(parts[0]))
-            dec   = " ".join(_int_to_words(int(d)) for d in parts[1]) if len(parts) > 1 else ""
-            return whole + (" point " + dec if dec else "") + " seconds"
-        except Exception:
-            return m.group(0)
-    text = re.sub(r'\b(\d+\.\d+)s\b', _float_s, text)
-
-    # Position "P3" → "P three" (keep the P prefix)
-    def _pos(m):
-        try:
-            return "P " + _int_to_words(int(m.group(1)))
-        except Exception:
-            return m.group(0)
-    text = re.sub(r'\bP(\d{1,2})\b', _pos, text)
 
-    # Plain integers (standalone)
-    def _plain(m):
-        try:
-            return _int_to_words(int(m.group(1)))
-        except Exception:
-            return m.group(0)
-    text = re.sub(r'(?<![A-Za-z])(\d{1,3})(?!\d|\.)', _plain, text)
+# Common F1 shorthand → full spoken form, keyed by the upper-cased match
+_FIXES: dict[str, str] = {
+    "SC":      "safety car",
+    "VSC":     "virtual safety car",
+    "DRS":     "D R S",
+    # Box box: ensure double for urgency
+    "BOX BOX": "box, box",
+}
+# One case-insensitive alternation over every fix, plus numeric sector refs
+# "S2" → "sector two", so the text is scanned once.
+_RE_FIXES = re.compile(r'\bSC\b|\bVSC\b|\bDRS\b|\bbox box\b|\bS(\d)\b', re.IGNORECASE)
 
-    return text
 
+def _fix_words(m: re.Match) -> str:
+    """_RE_FIXES.sub callback."""
+    digit = m.group(1)
+    if digit is not None:
+        return "sector " + _int_to_words(int(digit))
+    return _FIXES[m.group(0).upper()]
 
-_FIXES = [
-    # Common F1 shorthand → full spoken form
-    (r'\bSC\b',  "safety car"),
-    (r'\bVSC\b', "virtual safety car"),
-    (r'\bDRS\b', "D R S"),
-    # Box box: ensure double for urgency
-    (r'\bbox box\b', "box, box"),
-    # Numeric sector refs "S2" → "sector two"
-    (r'\bS(\d)\b', lambda m: "sector " + _int_to_words(int(m.group(1)))),
-]
 
 def _apply_fixes(text: str) -> str:
-    for pattern, replacement in _FIXES:
-        if callable(replacement):
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        else:
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-    return text
+    return _RE_FIXES.sub(_fix_words, text)
 
 
 def _strip_ssml(text: str) -> str:
@@ -193,7 +251,7 @@ def _strip_ssml(text: str) -> str:
     This sanitises any fallback messages that still contain V2-era break tags.
     """
     # Remove <break time="..."/> and any XML-style tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _RE_XML.sub('', text)
     return text
 
 
@@ -202,14 +260,16 @@ def _prepare_text(message: str) -> str:
     Full pipeline: normalise numbers → fix shorthand → strip SSML (V3).
     NOTE: When Kimi AI is working, it already writes numbers as words
     and uses [audio tags] instead of SSML. This pipeline is mainly a
-    safety net for hardcoded FALLBACK messages.
+    safety net for hardcoded FALLBACK messages — so clean Kimi output
+    is screened once by _NEEDS_WORK and skips the rewrite passes.
     """
-    message = _normalise_numbers(message)
-    message = _apply_fixes(message)
-    if _IS_V3:
-        # V3: strip any leftover SSML break tags (V2 artefacts)
-        message = _strip_ssml(message)
-    else:
+    if _NEEDS_WORK.search(message):
+        message = _normalise_numbers(message)
+        message = _apply_fixes(message)
+        if _IS_V3:
+            # V3: strip any leftover SSML break tags (V2 artefacts)
+            message = _strip_ssml(message)
+    if not _IS_V3:
         # V2: inject a single SSML break at the most natural pause point
         message = _add_natural_breaks_v2(message)
     return message
@@ -223,7 +283,7 @@ def _add_natural_breaks_v2(text: str) -> str:
     """
     if "<break" in text or len(text) < 20:
         return text
-    m = re.search(r'([.!?])\s+(?=\S)', text)
+    m = _RE_SENTENCE_END.search(text)
     if m:
         pos = m.end(1) + 1
         return text[: m.start(1) + 1] + ' <break time="0.45s"/> ' + text[pos:].lstrip()
@@ -233,11 +293,117 @@ def _add_natural_breaks_v2(text: str) -> str:
     return text
 
 
+# ─────────────────────────────────────────────────────────────
+#  Audio cache
+# ─────────────────────────────────────────────────────────────
+
+def _cache_key(message: str, previous_text: str) -> str:
+    """Hash everything that changes the generated audio. Doubles as the file stem."""
+    raw = (
+        f"{message}|{previous_text}|{_VOICE_ID}|{_ELEVENLABS_MODEL}|{_STABILITY}|"
+        f"{_SIMILARITY_BOOST}|{_STYLE}|{_SPEAKER_BOOST}|{_SPEED}"
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _cache_lookup(key: str) -> Optional[Path]:
+    """Return the cached clip for ``key`` (marking it recently used), or None."""
+    path = _TEMP_DIR / f"{key}.mp3"
+    try:
+        if path.stat().st_size > 0:
+            _AUDIO_CACHE[key] = path
+            _AUDIO_CACHE.move_to_end(key)
+            return path
+    except OSError:
+        pass
+    _AUDIO_CACHE.pop(key, None)
+    return None
+
+
+def _cache_store(key: str, path: Path) -> None:
+    """Register a clip and evict least-recently-used clips from disk over the cap."""
+    _AUDIO_CACHE[key] = path
+    _AUDIO_CACHE.move_to_end(key)
+    while len(_AUDIO_CACHE) > _CACHE_SIZE:
+        old_key, old = _AUDIO_CACHE.popitem(last=False)
+        if old_key in _PINNED:
+            continue   # still queued for playback — cleanup_audio deletes it
+        try:
+            old.unlink(missing_ok=True)
+        except OSError as e:
+            log.warning("Failed to evict cached audio %s: %s", old, e)
+
+
+def _pin(key: str, path: Path) -> str:
+    """Hold a cached clip on disk until cleanup_audio releases it."""
+    _PINNED[key] = _PINNED.get(key, 0) + 1
+    return str(path)
+
+
+def _load_cache_index() -> None:
+    """Adopt clips cached by a previous run (oldest first) so they stay bounded."""
+    try:
+        cached = sorted(
+            (p for p in _TEMP_DIR.glob("*.mp3") if len(p.stem) == 32),
+            key=lambda p: p.stat().st_mtime,
+        )
+    except OSError as e:
+        log.warning("Could not index TTS audio cache: %s", e)
+        return
+    for path in cached:
+        _cache_store(path.stem, path)
+
+
+if _CACHE_SIZE > 0:
+    _load_cache_index()
+
+
 # ─────────────────────────────────────────────────────────────
 #  Main TTS function
 # ─────────────────────────────────────────────────────────────
 
-async def generate_tts_audio(message: str, previous_text: str = "") -> Optional[str]:
+_STREAM_URL    = f"https://api.elevenlabs.io/v1/text-to-speech/{_VOICE_ID}/stream"
+_STREAM_PARAMS = {"output_format": "mp3_44100_128"}
+_STREAM_CHUNK  = 65536
+
+# Request body fields that never change between calls; only text is added per call
+_STATIC_BODY: dict = {
+    "model_id":       _ELEVENLABS_MODEL,
+    "voice_settings": _VOICE_SETTINGS,
+}
+
+
+# One shared async client for the process: the connection pool (and TLS
+# session) stays warm across the queue of radio calls, and the request goes
+# straight to the REST endpoint without the SDK's model validation layers.
+# HTTP/2 only when the optional h2 package is installed.
+_http = (
+    httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=30.0,
+        headers={"xi-api-key": _API_KEY},
+    )
+    if httpx is not None and _API_KEY else None
+)
+
+
+async def close_tts_client() -> None:
+    """Close the shared ElevenLabs HTTP client gracefully (call once on shutdown)."""
+    if _http is not None and not _http.is_closed:
+        await _http.aclose()
+        log.info("TTS HTTP client closed.")
+
+
+async def generate_tts_audio(
+    message: str,
+    previous_text: str = "",
+    *,
+    # Import-time constants bound as defaults so the hot path reads locals
+    _http=_http,
+    _body: dict = _STATIC_BODY,
+    _use_cache: bool = _CACHE_SIZE > 0,
+    _temp_dir: Path = _TEMP_DIR,
+) -> Optional[str]:
     """
     Convert ``message`` to speech using ElevenLabs.
 
@@ -253,62 +419,53 @@ async def generate_tts_audio(message: str, previous_text: str = "") -> Optional[
     if not _API_KEY or not _VOICE_ID:
         log.warning("ElevenLabs API key or voice ID not configured — skipping TTS.")
         return None
+    if _http is None:
+        log.warning("httpx not installed — skipping TTS.")
+        return None
 
     message = _prepare_text(message)
     log.debug("[TTS] Model: %s | Prepared: %s", _ELEVENLABS_MODEL, message)
 
-    try:
-        from elevenlabs import ElevenLabs, VoiceSettings
+    key = _cache_key(message, previous_text) if _use_cache else None
+    if key is not None:
+        cached = _cache_lookup(key)
+        if cached is not None:
+            log.info("TTS cache hit: %s", cached)
+            return _pin(key, cached)
 
-        client = ElevenLabs(api_key=_API_KEY)
-
-        # speed is a valid VoiceSettings field in elevenlabs SDK >= 1.9
-        try:
-            voice_settings = VoiceSettings(
-                stability=_STABILITY,
-                similarity_boost=_SIMILARITY_BOOST,
-                style=_STYLE,
-                use_speaker_boost=_SPEAKER_BOOST,
-                speed=_SPEED,
-            )
-        except TypeError:
-            # Older SDK: speed not yet in VoiceSettings
-            voice_settings = VoiceSettings(
-                stability=_STABILITY,
-                similarity_boost=_SIMILARITY_BOOST,
-                style=_STYLE,
-                use_speaker_boost=_SPEAKER_BOOST,
-            )
-            log.debug("SDK: speed not in VoiceSettings — skipping speed param")
-
-        convert_kwargs: dict = {
-            "voice_id":       _VOICE_ID,
-            "text":           message,
-            "model_id":       _ELEVENLABS_MODEL,
-            "voice_settings": voice_settings,
-            "output_format":  "mp3_44100_128",
-        }
+    try:
+        body = {**_body, "text": message}
 
         # Add previous_text for prosodic continuity if provided
         if previous_text:
-            convert_kwargs["previous_text"] = previous_text
-
-        # Try with EL's own text normalization as a safety net for fallback messages
-        try:
-            convert_kwargs["apply_text_normalization"] = "on"
-            audio_generator = client.text_to_speech.convert(**convert_kwargs)
-        except TypeError:
-            convert_kwargs.pop("apply_text_normalization", None)
-            log.debug("SDK: apply_text_normalization not supported — skipping")
-            audio_generator = client.text_to_speech.convert(**convert_kwargs)
-
-        filename = _TEMP_DIR / f"radio_{uuid.uuid4().hex}.mp3"
-        with open(filename, "wb") as f:
-            for chunk in audio_generator:
-                if chunk:
-                    f.write(chunk)
-
-        log.info("TTS audio saved: %s (%d bytes)", filename, filename.stat().st_size)
+            body["previous_text"] = previous_text
+
+        # Collect the streamed chunks and hit the disk with one contiguous write
+        buf = bytearray()
+        async with _http.stream("POST", _STREAM_URL, params=_STREAM_PARAMS, json=body) as resp:
+            if resp.status_code != 200:
+                detail = await resp.aread()
+                log.error("ElevenLabs TTS HTTP %d: %s", resp.status_code,
+                          detail[:200].decode("utf-8", errors="replace"))
+                return None
+            async for chunk in resp.aiter_bytes(_STREAM_CHUNK):
+                buf.extend(chunk)
+        if not buf:
+            log.error("ElevenLabs TTS returned no audio.")
+            return None
+
+        filename = _temp_dir / f"radio_{os.getpid()}_{next(_FILE_COUNTER)}.mp3"
+        async with aiofiles.open(filename, "wb") as f:
+            await f.write(buf)
+        if key is not None:
+            # Publish under the cache name only once fully written
+            cached = _temp_dir / f"{key}.mp3"
+            os.replace(filename, cached)
+            _cache_store(key, cached)
+            log.info("TTS audio saved: %s (%d bytes)", cached, len(buf))
+            return _pin(key, cached)
+
+        log.info("TTS audio saved: %s (%d bytes)", filename, len(buf))
         return str(filename)
 
     except Exception as e:
@@ -317,9 +474,22 @@ async def generate_tts_audio(message: str, previous_text: str = "") -> Optional[
 
 
 def cleanup_audio(file_path: str) -> None:
-    """Delete a temporary audio file after playback."""
+    """
+    Delete a temporary audio file after playback.
+    Clips held by the audio cache are kept — the LRU evicts them instead.
+    Every path returned by generate_tts_audio must come back through here once.
+    """
     try:
         path = Path(file_path)
+        key = path.stem
+        pins = _PINNED.get(key)
+        if pins is not None:
+            if pins > 1:
+                _PINNED[key] = pins - 1
+            else:
+                del _PINNED[key]
+        if key in _AUDIO_CACHE or key in _PINNED:
+            return
         if path.exists():
             path.unlink()
             log.debug("Cleaned up audio file: %s", file_path)
@@ -141,6 +141,8 @@ class F1EngineerBot(commands.Bot):
         log.info("Shutting down bot...")
         if self._telemetry_listener:
             await self._telemetry_listener.stop()
+        from engineer.tts import close_tts_client
+        await close_tts_client()
         from database.db import close_db
         await close_db()
         await self.voice_manager.disconnect()
@@ -13,17 +13,25 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import socket
 import struct
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable, Awaitable
 
 from .state import GameState, game_state
-from .parser import PacketParser
+from .parser import (
+    PacketParser,
+    PACKET_SESSION, PACKET_LAP_DATA, PACKET_EVENT, PACKET_PARTICIPANTS,
+    PACKET_CAR_DAMAGE, PACKET_CAR_TELEMETRY, PACKET_CAR_STATUS,
+)
 
 log = logging.getLogger("f1bot.listener")
 
 UDP_PORT          = int(os.getenv("UDP_PORT", "20777"))
 TELEMETRY_TIMEOUT = 30.0   # seconds before warning about lost telemetry
+UDP_RCVBUF_BYTES  = 4 * 1024 * 1024   # headroom for session/participants bursts
+PACKET_QUEUE_SIZE = 256                # datagrams buffered between socket and decoder
 
 # ── Try to import f1-packets (optional accelerator) ──────────────────────────
 _decode_packet = None
@@ -50,18 +58,20 @@ except ImportError:
 # m_packetVersion u8, m_packetId u8, m_sessionUID u64, m_sessionTime f32,
 # m_frameIdentifier u32, m_overallFrameIdentifier u32,
 # m_playerCarIndex u8, m_secondaryPlayerCarIndex u8
-_HEADER_FMT  = "<HBBBBBQfIIBB"
-_HEADER_SIZE = struct.calcsize(_HEADER_FMT)   # 29 bytes
+_HEADER_FMT    = "<HBBBBBQfIIBB"
+_HEADER_STRUCT = struct.Struct(_HEADER_FMT)   # format parsed once, not per packet
+_HEADER_SIZE   = _HEADER_STRUCT.size          # 29 bytes
+# m_packetId sits after u16 format + four u8 version fields → byte 6
+_PACKET_ID_OFFSET = struct.calcsize("<HBBBB")
 
 PacketId = int  # type alias
 
-PACKET_SESSION        = 1
-PACKET_LAP_DATA       = 2
-PACKET_EVENT          = 3
-PACKET_PARTICIPANTS   = 4
-PACKET_CAR_DAMAGE     = 10
-PACKET_CAR_TELEMETRY  = 6
-PACKET_CAR_STATUS     = 7
+# Packet ids the parser consumes; everything else (motion, tyre sets, lap
+# positions, …) is dropped before the decoder spends time on it
+_WANTED: frozenset[PacketId] = frozenset({
+    PACKET_SESSION, PACKET_LAP_DATA, PACKET_EVENT, PACKET_PARTICIPANTS,
+    PACKET_CAR_TELEMETRY, PACKET_CAR_STATUS, PACKET_CAR_DAMAGE,
+})
 
 
 class _RawHeader:
@@ -78,7 +88,7 @@ class _RawHeader:
             self.packet_version, self.packet_id, self.session_uid, self.session_time,
             self.frame_id, self.overall_frame_id,
             self.player_car_index, self.secondary_player_car_index,
-        ) = struct.unpack_from(_HEADER_FMT, data)
+        ) = _HEADER_STRUCT.unpack_from(data)
 
 
 class TelemetryListener:
@@ -112,7 +122,14 @@ class TelemetryListener:
         self._running            = False
         self._transport: Optional[asyncio.DatagramTransport] = None
         self._watchdog_task: Optional[asyncio.Task]          = None
+        self._drain_task: Optional[asyncio.Task]             = None
+        self._queue: asyncio.Queue[tuple[PacketId, bytes]] = asyncio.Queue(maxsize=PACKET_QUEUE_SIZE)
+        # One worker keeps packets decoded in arrival order; handlers still
+        # run on the loop so GameState is only ever mutated from one thread
+        self._decoder: Optional[ThreadPoolExecutor]          = None
+        self._dropped                                        = 0
         self._player_indices_resolved                        = False
+        self._pkt_counter                                    = 0
 
     async def start(self) -> None:
         log.info("Starting F1 25 telemetry listener on 0.0.0.0:%d", UDP_PORT)
@@ -123,46 +140,98 @@ class TelemetryListener:
             lambda: _UDPProtocol(self._on_packet_received),
             local_addr=("0.0.0.0", UDP_PORT),
         )
+        self._raise_receive_buffer()
 
+        if _decode_packet is not None:
+            self._decoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="f1-decode")
+        self._drain_task    = asyncio.create_task(self._drain())
         self._watchdog_task = asyncio.create_task(self._watchdog())
         log.info("Telemetry listener started.")
 
+    def _raise_receive_buffer(self) -> None:
+        """
+        Enlarge SO_RCVBUF so packets queue in the kernel instead of being
+        dropped while a callback briefly blocks the event loop. The OS may
+        clamp the request (net.core.rmem_max on Linux); that is not an error.
+        """
+        sock = self._transport.get_extra_info("socket") if self._transport else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RCVBUF_BYTES)
+            log.debug("UDP receive buffer: %d bytes",
+                      sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF))
+        except OSError as e:
+            log.warning("Could not raise UDP receive buffer: %s", e)
+
     async def stop(self) -> None:
         self._running = False
         if self._transport:
             self._transport.close()
         if self._watchdog_task:
             self._watchdog_task.cancel()
+        if self._drain_task:
+            self._drain_task.cancel()
+        if self._decoder:
+            self._decoder.shutdown(wait=False, cancel_futures=True)
+            self._decoder = None
         log.info("Telemetry listener stopped.")
 
     def _on_packet_received(self, data: bytes) -> None:
-        """Called per datagram. Decode and delegate to parser."""
-        if len(data) < _HEADER_SIZE:
+        """Called per datagram on the event loop. Filter, then queue for the drain task."""
+        pid = self._admit(data)
+        if pid is None:
             return
-
         try:
-            header = _RawHeader(data)
-        except struct.error:
-            return
+            self._queue.put_nowait((pid, data))
+        except asyncio.QueueFull:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 1000 == 0:
+                log.warning("Packet queue full — %d datagrams dropped so far", self._dropped)
+
+    async def _drain(self) -> None:
+        """Consume queued datagrams: decode off-loop, then hand to the parser."""
+        loop = asyncio.get_running_loop()
+        while True:
+            pid, data = await self._queue.get()
+            try:
+                if _decode_packet is not None:
+                    # Use f1-packets library for structured packet objects —
+                    # no need to build a _RawHeader on this path
+                    packet = await loop.run_in_executor(self._decoder, _decode_packet, data)
+                    if packet is not None:
+                        self.parser.process_by_id(pid, packet)
+                else:
+                    # Raw fallback: pass a lightweight wrapper to the parser
+                    self.parser.process_raw(_RawHeader(data), data)
+            except Exception as e:
+                log.debug("Packet processing error (ID=%d, %d bytes): %s",
+                          pid, len(data), e)
+
+    def _admit(self, data: bytes) -> Optional[PacketId]:
+        """
+        Cheap header-level checks before decoding. Returns the packet id if
+        the datagram should be decoded, or None to drop it.
+        """
+        if len(data) < _HEADER_SIZE:
+            return None
 
         # Auto-detect player car indices from the first valid header
         if not self._player_indices_resolved:
-            self._resolve_player_indices(header)
+            try:
+                self._resolve_player_indices(_RawHeader(data))
+            except struct.error:
+                return None
 
-        try:
-            if _decode_packet is not None:
-                # Use f1-packets library for structured packet objects
-                packet = _decode_packet(data)
-                if packet is not None:
-                    self.parser.process(packet)
-            else:
-                # Raw fallback: pass a lightweight wrapper to the parser
-                self.parser.process_raw(header, data)
-        except Exception as e:
-            log.debug("Packet processing error (ID=%d, %d bytes): %s",
-                      header.packet_id, len(data), e)
-
-        self.gs.last_packet_time = time.time()
+        # Liveness only matters at watchdog resolution (seconds), so stamp
+        # the monotonic clock once every 16 packets instead of on each one.
+        # Done before filtering so any traffic at all keeps the watchdog quiet.
+        self._pkt_counter = (self._pkt_counter + 1) & 15
+        if self._pkt_counter == 1:
+            self.gs.last_packet_time = time.monotonic()
+
+        pid = data[_PACKET_ID_OFFSET]
+        return pid if pid in _WANTED else None
 
     def _resolve_player_indices(self, header: _RawHeader) -> None:
         """
@@ -191,7 +260,7 @@ class TelemetryListener:
     async def _watchdog(self) -> None:
         while self._running:
             await asyncio.sleep(10)
-            elapsed = time.time() - self.gs.last_packet_time
+            elapsed = time.monotonic() - self.gs.last_packet_time
             if elapsed > TELEMETRY_TIMEOUT:
                 log.warning("Telemetry timeout: no packet for %.0fs", elapsed)
                 if self.on_telemetry_lost:
@@ -5,156 +5,381 @@ Supports both m_camelCase (legacy) and snake_case (f1.packets) attribute names.
 """
 
 from __future__ import annotations
+import functools
 import logging
+import struct
+import sys
 import time
-from typing import Any
+from collections import namedtuple
+from operator import attrgetter
+from typing import Any, Callable, Optional
 
-from .state import GameState, PlayerState, CarSnapshot, TyreWear, CarDamage, WeatherForecast
+from .state import GameState, PlayerState, WeatherForecast
 
 log = logging.getLogger("f1bot.parser")
 
 
+_MISSING = object()
+
+
 def _attr(obj: Any, *names: str, default: Any = 0) -> Any:
     """Get attribute trying m_camelCase then snake_case (f1-packets compatibility)."""
     for name in names:
-        if hasattr(obj, name):
-            return getattr(obj, name)
+        # One getattr with a sentinel: no hasattr double lookup per name
+        value = getattr(obj, name, _MISSING)
+        if value is not _MISSING:
+            return value
     return default
 
 
+class _FieldSpec:
+    """
+    The fields read from one packet struct, each with its candidate attribute
+    names. The naming scheme is fixed for a given decoder, so on first sight
+    every field is resolved to one attrgetter (or a constant default) and the
+    per-name probing of _attr is skipped for every later packet.
+    """
+    __slots__ = ("_fields", "_defaults", "_getters_type")
+
+    def __init__(
+        self,
+        typename: str,
+        fields: dict[str, tuple[str, ...]],
+        defaults: Optional[dict[str, Any]] = None,
+    ):
+        self._fields       = fields
+        self._defaults     = defaults or {}
+        self._getters_type = namedtuple(typename, fields)
+
+    def specialize(self, sample: Any) -> tuple:
+        """Resolve each field against ``sample`` → namedtuple of getters."""
+        getters: list[Callable[[Any], Any]] = []
+        for field, names in self._fields.items():
+            for name in names:
+                if getattr(sample, name, _MISSING) is not _MISSING:
+                    getters.append(attrgetter(name))
+                    break
+            else:
+                getters.append(_constant(self._defaults.get(field, 0)))
+        return self._getters_type(*getters)
+
+
+def _constant(value: Any) -> Callable[[Any], Any]:
+    return lambda _obj: value
+
+
+def _first_yellow_sector(
+    zones: Any, get_flag: Callable[[Any], Any], get_start: Callable[[Any], Any]
+) -> int:
+    """Sector (1-3) of the first yellow marshal zone, or 0 if none is yellow."""
+    for zone in zones:
+        if get_flag(zone) == 3:  # yellow
+            start = float(get_start(zone) or 0.0)
+            # S1 < 0.35 ≤ S2 < 0.67 ≤ S3 — boundaries belong to the later sector
+            return 1 + (start >= 0.35) + (start >= 0.67)
+    return 0
+
+
+def _reprobe_on_schema_change(handler: Callable) -> Callable:
+    """A field vanished (decoder swapped/upgraded): drop cached getters so the next packet re-probes."""
+    @functools.wraps(handler)
+    def wrapper(self: "PacketParser", pkt: Any) -> None:
+        try:
+            handler(self, pkt)
+        except AttributeError:
+            self._getters.clear()
+            raise
+    return wrapper
+
+
+_SESSION_FIELDS = _FieldSpec("SessionFields", {
+    "session_type":      ("m_sessionType", "session_type"),
+    "track_id":          ("m_trackId", "track_id"),
+    "total_laps":        ("m_totalLaps", "total_laps"),
+    "weather":           ("m_weather", "weather"),
+    "safety_car_status": ("m_safetyCarStatus", "safety_car_status"),
+    "track_length":      ("m_trackLength", "track_length"),
+    "forecast_samples":  ("m_weatherForecastSamples", "weather_forecast_samples"),
+    "marshal_zones":     ("m_marshalZones", "marshal_zones"),
+}, defaults={"forecast_samples": ()})
+
+_FORECAST_FIELDS = _FieldSpec("ForecastFields", {
+    "session_type":    ("m_sessionType", "session_type"),
+    "weather":         ("m_weather", "weather"),
+    "rain_percentage": ("m_rainPercentage", "rain_percentage"),
+    "time_offset":     ("m_timeOffset", "time_offset"),
+})
+
+_ZONE_FIELDS = _FieldSpec("ZoneFields", {
+    "flag":  ("m_zoneFlag", "zone_flag"),
+    "start": ("m_zoneStart", "zone_start"),
+})
+
+_LAP_FIELDS = _FieldSpec("LapFields", {
+    "position":            ("m_carPosition", "car_position"),
+    "current_lap":         ("m_currentLapNum", "current_lap_num"),
+    "pit_status":          ("m_pitStatus", "pit_status"),
+    "lead_ms":             ("m_deltaToRaceLeaderMSPart", "delta_to_race_leader_ms_part"),
+    "lead_min":            ("m_deltaToRaceLeaderMinutesPart", "delta_to_race_leader_minutes_part"),
+    "lead_legacy_ms":      ("m_deltaToRaceLeaderInMS",),
+    "current_lap_time_ms": ("m_currentLapTimeInMS", "current_lap_time_in_ms"),
+    "last_lap_time_ms":    ("m_lastLapTimeInMS", "last_lap_time_in_ms"),
+    "best_lap_time_ms":    ("m_bestLapTimeInMS", "best_lap_time_in_ms"),
+    "sector":              ("m_sector", "sector"),
+    "pit_lane_timer":      ("m_pitLaneTimerActive", "pit_lane_timer_active"),
+    "fia_flags":           ("m_vehicleFiaFlags", "vehicle_fia_flags"),
+    "lap_distance":        ("m_lapDistance", "lap_distance"),
+    "penalties":           ("m_penalties", "penalties"),
+    "drive_through":       ("m_numUnservedDriveThroughPens", "num_unserved_drive_through_pens"),
+    "stop_go":             ("m_numUnservedStopGoPens", "num_unserved_stop_go_pens"),
+    "s1_ms":               ("m_sector1TimeMSPart", "sector1_time_ms_part"),
+    "s1_min":              ("m_sector1TimeMinutesPart", "sector1_time_minutes_part"),
+    "s1_legacy_ms":        ("m_sector1TimeInMS",),
+    "s2_ms":               ("m_sector2TimeMSPart", "sector2_time_ms_part"),
+    "s2_min":              ("m_sector2TimeMinutesPart", "sector2_time_minutes_part"),
+    "s2_legacy_ms":        ("m_sector2TimeInMS",),
+    "ahead_ms":            ("m_deltaToCarInFrontMSPart", "delta_to_car_in_front_ms_part"),
+    "ahead_min":           ("m_deltaToCarInFrontMinutesPart", "delta_to_car_in_front_minutes_part"),
+    "ahead_legacy_ms":     ("m_deltaToCarInFrontInMS",),
+    "behind_ms":           ("m_deltaToCarBehindMSPart", "delta_to_car_behind_ms_part"),
+    "behind_min":          ("m_deltaToCarBehindMinutesPart", "delta_to_car_behind_minutes_part"),
+    "behind_legacy_ms":    ("m_deltaToCarBehindInMS",),
+}, defaults={"fia_flags": None, "s1_ms": None, "s2_ms": None})
+
+_TELEMETRY_FIELDS = _FieldSpec("TelemetryFields", {
+    "drs":              ("m_drs", "drs"),
+    "speed":            ("m_speed", "speed"),
+    "tyres_inner_temp": ("m_tyresInnerTemperature", "tyres_inner_temperature"),
+})
+
+_STATUS_FIELDS = _FieldSpec("StatusFields", {
+    "fuel_in_tank":         ("m_fuelInTank", "fuel_in_tank"),
+    "fuel_remaining_laps":  ("m_fuelRemainingLaps", "fuel_remaining_laps"),
+    "fuel_mix":             ("m_fuelMix", "fuel_mix"),
+    "ers_store_energy":     ("m_ersStoreEnergy", "ers_store_energy"),
+    "ers_deploy_mode":      ("m_ersDeployMode", "ers_deploy_mode"),
+    "drs_allowed":          ("m_drsAllowed", "drs_allowed"),
+    "visual_tyre_compound": ("m_visualTyreCompound", "visual_tyre_compound"),
+    "fia_flags":            ("m_vehicleFiaFlags", "vehicle_fia_flags"),
+    "tyres_age_laps":       ("m_tyresAgeLaps", "tyres_age_laps"),
+}, defaults={"fuel_in_tank": 0.0, "fuel_remaining_laps": 0.0, "fuel_mix": 1,
+             "ers_store_energy": 0.0, "fia_flags": -1})
+
+_DAMAGE_FIELDS = _FieldSpec("DamageFields", {
+    "fl_wing":    ("m_frontLeftWingDamage", "front_left_wing_damage"),
+    "fr_wing":    ("m_frontRightWingDamage", "front_right_wing_damage"),
+    "rear_wing":  ("m_rearWingDamage", "rear_wing_damage"),
+    "floor":      ("m_floorDamage", "floor_damage"),
+    "diffuser":   ("m_diffuserDamage", "diffuser_damage"),
+    "sidepod":    ("m_sidepodDamage", "sidepod_damage"),
+    "tyres_wear": ("m_tyresWear", "tyres_wear"),
+})
+
+_PARTICIPANT_FIELDS = _FieldSpec("ParticipantFields", {
+    "name": ("m_name", "name"),
+})
+
+
+# F1 25 m_packetId values for the packets the parser handles
+PACKET_SESSION        = 1
+PACKET_LAP_DATA       = 2
+PACKET_EVENT          = 3
+PACKET_PARTICIPANTS   = 4
+PACKET_CAR_DAMAGE     = 10
+PACKET_CAR_TELEMETRY  = 6
+PACKET_CAR_STATUS     = 7
+
+
+# ── Raw fallback layouts (F1 25 UDP spec) ─────────────────────────────────────
+# Used by process_raw when f1-packets is not installed. Rows are exposed under
+# the m_camelCase names so the normal handlers (and their getters) apply as-is.
+_RAW_HEADER_SIZE   = struct.calcsize("<HBBBBBQfIIBB")   # 29 bytes
+_RAW_NUM_CARS      = 22
+
+# LapData: 57 bytes per car
+_RAW_LAP_STRUCT = struct.Struct("<IIHBHBHBHBfffBBBBBBBBBBBBBBBHHBfB")
+_RawLapData = namedtuple("_RawLapData", (
+    "m_lastLapTimeInMS", "m_currentLapTimeInMS",
+    "m_sector1TimeMSPart", "m_sector1TimeMinutesPart",
+    "m_sector2TimeMSPart", "m_sector2TimeMinutesPart",
+    "m_deltaToCarInFrontMSPart", "m_deltaToCarInFrontMinutesPart",
+    "m_deltaToRaceLeaderMSPart", "m_deltaToRaceLeaderMinutesPart",
+    "m_lapDistance", "m_totalDistance", "m_safetyCarDelta",
+    "m_carPosition", "m_currentLapNum", "m_pitStatus", "m_numPitStops",
+    "m_sector", "m_currentLapInvalid", "m_penalties", "m_totalWarnings",
+    "m_cornerCuttingWarnings", "m_numUnservedDriveThroughPens",
+    "m_numUnservedStopGoPens", "m_gridPosition", "m_driverStatus",
+    "m_resultStatus", "m_pitLaneTimerActive", "m_pitLaneTimeInLaneInMS",
+    "m_pitStopTimerInMS", "m_pitStopShouldServePen",
+    "m_speedTrapFastestSpeed", "m_speedTrapFastestLap",
+))
+_RawLapPacket = namedtuple("_RawLapPacket", ("m_lapData",))
+_RAW_LAP_END  = _RAW_HEADER_SIZE + _RAW_NUM_CARS * _RAW_LAP_STRUCT.size
+
+# Event codes that end the session for the players
+_FINISH_EVENT_CODES = (b"CHQF", b"SEND")   # Chequered Flag, Session End
+
+# Non-player damage only feeds the "car ahead is damaged" call, which doesn't
+# need the full 10 Hz: refresh the rest of the grid every Nth damage packet
+_GRID_DAMAGE_EVERY = 5
+
+
 class PacketParser:
     """Stateful parser that maps F1 25 packet data onto the shared GameState."""
 
     def __init__(self, game_state: GameState):
         self.gs = game_state
-
-    def process(self, packet: Any) -> None:
-        """Dispatch a decoded f1-packets packet to the appropriate handler."""
-        try:
-            ptype = type(packet).__name__
-            handler = _HANDLERS.get(ptype)
-            if handler:
-                handler(self, packet)
-            self.gs.last_packet_time = time.time()
-        except Exception as e:
-            log.debug("Error processing packet %s: %s", type(packet).__name__, e)
+        self._getters: dict[_FieldSpec, tuple] = {}
+        # Packet id → handler bound to this parser once, so dispatch is a single call
+        self._bound_handlers: dict[int, Callable[[Any], None]] = {
+            pid: getattr(self, fn.__name__) for pid, fn in _HANDLERS.items()
+        }
+        # Last forecast seen: raw (session, weather, rain %, offset) rows + built objects
+        self._forecast_rows: tuple = ()
+        self._forecast: tuple[WeatherForecast, ...] = ()
+        self._damage_tick = 0
+
+    def _fields(self, spec: _FieldSpec, sample: Any) -> tuple:
+        """Getters for ``spec``, specialised to the decoder's naming on first use."""
+        getters = self._getters.get(spec)
+        if getters is None:
+            getters = self._getters[spec] = spec.specialize(sample)
+        return getters
+
+    def process_by_id(self, packet_id: int, packet: Any) -> None:
+        """Dispatch a decoded f1-packets packet by its header m_packetId."""
+        handler = self._bound_handlers.get(packet_id)
+        if handler is not None:
+            handler(packet)
 
     def process_raw(self, header: Any, data: bytes) -> None:
         """
         Fallback raw processing path used when f1-packets is not installed.
-        Currently a no-op stub — instruct the user to install f1-packets for
-        full packet parsing support.  The listener still tracks last_packet_time
-        so the watchdog doesn't fire false alarms.
+        Decodes LapData (positions, laps, gaps, sectors, penalties) straight
+        from the datagram with precompiled structs; other packet types still
+        need f1-packets. The listener tracks last_packet_time either way.
         """
-        # No-op: raw struct parsing of all packets is out of scope without the library.
-        # The listener already updates gs.last_packet_time after calling this.
-        pass
+        if header.packet_id != PACKET_LAP_DATA or len(data) < _RAW_LAP_END:
+            return
+        rows = _RAW_LAP_STRUCT.iter_unpack(memoryview(data)[_RAW_HEADER_SIZE:_RAW_LAP_END])
+        self._handle_lap_data(_RawLapPacket(list(map(_RawLapData._make, rows))))
 
     # ──────────────────────────────────────────
     # SESSION DATA  (PacketSessionData)
     # ──────────────────────────────────────────
+    @_reprobe_on_schema_change
     def _handle_session(self, pkt: Any) -> None:
         uid = _attr(pkt, "m_sessionUID") or (getattr(pkt.header, "session_uid", 0) if hasattr(pkt, "header") else 0)
         self.gs.session_uid = uid
-        session_type = _attr(pkt, "m_sessionType", "session_type")
-        track_id = _attr(pkt, "m_trackId", "track_id")
-        total_laps = _attr(pkt, "m_totalLaps", "total_laps")
-        weather = _attr(pkt, "m_weather", "weather")
-        for idx, ps in self.gs.players.items():
+        g = self._fields(_SESSION_FIELDS, pkt)
+        session_type = g.session_type(pkt)
+        track_id = g.track_id(pkt)
+        total_laps = g.total_laps(pkt)
+        weather = g.weather(pkt)
+        # Interned so track_context's TRACK_DB lookup short-circuits on identity
+        # (the fallback f-string is only built for unknown ids)
+        track_name = sys.intern(_TRACK_NAMES.get(track_id) or f"Track{track_id}")
+        safety_car_status = g.safety_car_status(pkt)
+        track_length_m = float(g.track_length(pkt) or 0.0)
+        for ps in self.gs.active_players():
             ps.session_type       = session_type
-            ps.track_name         = _TRACK_NAMES.get(track_id, f"Track{track_id}")
+            ps.track_name         = track_name
             ps.total_laps         = total_laps
             ps.weather            = weather
-            ps.safety_car_status  = _attr(pkt, "m_safetyCarStatus", "safety_car_status")
-            ps.track_length_m     = float(_attr(pkt, "m_trackLength", "track_length") or 0.0)
+            ps.safety_car_status  = safety_car_status
+            ps.track_length_m     = track_length_m
 
         # Parse weather forecast (m_weatherForecastSamples or weather_forecast_samples)
-        samples = _attr(pkt, "m_weatherForecastSamples", "weather_forecast_samples")
-        if samples is None:
-            samples = []
-        forecasts = []
-        for fc in samples:
-            f = WeatherForecast(
-                session_num=_attr(fc, "m_sessionType", "session_type"),
-                weather=_attr(fc, "m_weather", "weather"),
-                rain_percentage=_attr(fc, "m_rainPercentage", "rain_percentage"),
-                time_offset=_attr(fc, "m_timeOffset", "time_offset"),
+        samples = g.forecast_samples(pkt)
+        rows: tuple = ()
+        if samples:
+            fg = self._fields(_FORECAST_FIELDS, samples[0])
+            rows = tuple(
+                (fg.session_type(fc), fg.weather(fc), fg.rain_percentage(fc), fg.time_offset(fc))
+                for fc in samples
             )
-            forecasts.append(f)
-
-        for ps in self.gs.players.values():
+        # The forecast rarely changes between session packets: only build new
+        # WeatherForecast objects when the raw values do, and share one tuple
+        if rows != self._forecast_rows:
+            self._forecast_rows = rows
+            self._forecast = tuple(WeatherForecast(*row) for row in rows)
+        forecasts = self._forecast
+
+        for ps in self.gs.active_players():
             ps.weather_forecast = forecasts
 
         # ── Marshal zones → which sector currently has a yellow flag?
         # m_marshalZones: list of zones with m_zoneStart (0.0-1.0) and m_zoneFlag
         # Flag values: 0=unknown, 1=green, 2=blue, 3=yellow, 4=red
         # We approximate sector by track fraction: S1=0.0-0.35, S2=0.35-0.67, S3=0.67-1.0
-        zones = _attr(pkt, "m_marshalZones", "marshal_zones")
+        zones = g.marshal_zones(pkt)
         yellow_sector = 0
         if zones:
-            for zone in zones:
-                flag = _attr(zone, "m_zoneFlag", "zone_flag")
-                if flag == 3:  # yellow
-                    start = float(_attr(zone, "m_zoneStart", "zone_start") or 0.0)
-                    if start < 0.35:
-                        yellow_sector = 1
-                    elif start < 0.67:
-                        yellow_sector = 2
-                    else:
-                        yellow_sector = 3
-                    break  # use the first yellow zone found
-        for ps in self.gs.players.values():
+            zg = self._fields(_ZONE_FIELDS, zones[0])
+            yellow_sector = _first_yellow_sector(zones, zg.flag, zg.start)
+        for ps in self.gs.active_players():
             ps.yellow_flag_sector = yellow_sector
 
     # ──────────────────────────────────────────
     # LAP DATA  (PacketLapData)
     # ──────────────────────────────────────────
+    @_reprobe_on_schema_change
     def _handle_lap_data(self, pkt: Any) -> None:
         lap_data = _attr(pkt, "m_lapData", "lap_data")
-        if lap_data is None:
+        if not lap_data:
             return
+        g = self._fields(_LAP_FIELDS, lap_data[0])
+        now = time.time()   # one timestamp for the whole snapshot
 
-        # ── Pass 1: build leaderboard snapshot for ALL 20 cars ──────────────────
+        # Single pass over the grid: every car gets its leaderboard snapshot,
+        # player cars then reuse the values already read for the full update
+        all_cars = self.gs.all_cars
+        players  = self.gs.players
         for car_idx, lap in enumerate(lap_data):
-            if car_idx not in self.gs.all_cars:
-                self.gs.all_cars[car_idx] = CarSnapshot()
-            snap = self.gs.all_cars[car_idx]
-            snap.position    = _attr(lap, "m_carPosition", "car_position")
-            snap.current_lap = _attr(lap, "m_currentLapNum", "current_lap_num")
-            snap.pit_status  = _attr(lap, "m_pitStatus", "pit_status")
+            snap = all_cars[car_idx]
+            snap.position    = g.position(lap)
+            snap.current_lap = g.current_lap(lap)
+            snap.pit_status  = g.pit_status(lap)
 
             # Gap to race leader (F1 24/25 split fields, legacy fallback)
-            raw_lead_ms  = _attr(lap, "m_deltaToRaceLeaderMSPart",      "delta_to_race_leader_ms_part")
-            raw_lead_min = _attr(lap, "m_deltaToRaceLeaderMinutesPart", "delta_to_race_leader_minutes_part")
+            raw_lead_ms  = g.lead_ms(lap)
+            raw_lead_min = g.lead_min(lap)
             if raw_lead_ms is None:
-                raw_lead_ms  = _attr(lap, "m_deltaToRaceLeaderInMS", default=0)
+                raw_lead_ms  = g.lead_legacy_ms(lap)
                 raw_lead_min = 0
             snap.gap_to_leader_sec = (
                 int(raw_lead_ms or 0) + int(raw_lead_min or 0) * 60_000
             ) / 1000.0
 
-        # ── Pass 2: update player cars with full lap data + penalties ───────────
-        for car_idx, lap in enumerate(lap_data):
-            if car_idx not in self.gs.players:
+            # ── Player cars: full lap data + penalties
+            ps: Optional[PlayerState] = players[car_idx]
+            if ps is None:
                 continue
-            ps: PlayerState = self.gs.players[car_idx]
+
+            # Lap and sector times only change while the lap clock runs; on a
+            # stale tick (paused, menus, replayed frame) skip re-decoding them
+            cur_ms = g.current_lap_time_ms(lap)
+            clock_moved = (cur_ms != ps.current_lap_time_ms
+                           or snap.current_lap != ps.current_lap)
+
             ps.prev_position    = ps.current_position
-            ps.current_position = _attr(lap, "m_carPosition", "car_position")
+            ps.current_position = snap.position
 
             prev_lap       = ps.current_lap
-            ps.current_lap = _attr(lap, "m_currentLapNum", "current_lap_num")
+            ps.current_lap = snap.current_lap
 
             # Reset per-lap speed tracker when lap number advances
             if ps.current_lap != prev_lap:
                 ps.max_speed_this_lap = 0.0
 
-            ps.current_lap_time_ms = _attr(lap, "m_currentLapTimeInMS", "current_lap_time_in_ms")
-            ps.last_lap_time_ms    = _attr(lap, "m_lastLapTimeInMS",    "last_lap_time_in_ms")
-            ps.best_lap_time_ms    = _attr(lap, "m_bestLapTimeInMS",    "best_lap_time_in_ms")
-            ps.sector              = _attr(lap, "m_sector", "sector") + 1
-            ps.pit_status          = _attr(lap, "m_pitStatus", "pit_status")
-            ps.pit_limiter_status  = _attr(lap, "m_pitLaneTimerActive", "pit_lane_timer_active")
-            ps.vehicle_fia_flags   = _attr(lap, "m_vehicleFiaFlags", "vehicle_fia_flags", default=-1)
+            ps.current_lap_time_ms = cur_ms
+            ps.sector              = g.sector(lap) + 1
+            ps.pit_status          = snap.pit_status
+            ps.pit_limiter_status  = g.pit_lane_timer(lap)
+            # F1 25 LapData has no FIA flag (CarStatus does) — don't clobber it
+            fia_flags = g.fia_flags(lap)
+            if fia_flags is not None:
+                ps.vehicle_fia_flags = fia_flags
 
             # Tyre age fallback: detect pit completion from pit_status 1/2→0
             # m_tyresAgeLaps (F1 24+) is preferred; this handles older UDP versions.
@@ -167,151 +392,172 @@ class PacketParser:
                 ps.tyre_age_laps = max(0, ps.current_lap - ps.tyre_change_lap)
 
             # Track position (for corner awareness)
-            raw_dist = _attr(lap, "m_lapDistance", "lap_distance")
+            raw_dist = g.lap_distance(lap)
             if raw_dist is not None:
                 ps.lap_distance_m = float(raw_dist)
 
             # Penalties
-            ps.penalty_seconds  = int(_attr(lap, "m_penalties",                       "penalties"))
-            ps.num_drive_through = int(_attr(lap, "m_numUnservedDriveThroughPens",   "num_unserved_drive_through_pens"))
-            ps.num_stop_go       = int(_attr(lap, "m_numUnservedStopGoPens",          "num_unserved_stop_go_pens"))
-
-            # ── Sector times (F1 24/25 split MSPart + MinutesPart)
-            s1_ms  = _attr(lap, "m_sector1TimeMSPart",      "sector1_time_ms_part")
-            s1_min = _attr(lap, "m_sector1TimeMinutesPart", "sector1_time_minutes_part")
-            if not hasattr(lap, "m_sector1TimeMSPart") and not hasattr(lap, "sector1_time_ms_part"):
-                s1_ms = _attr(lap, "m_sector1TimeInMS", default=0); s1_min = 0
-            ps.sector1_ms = int(s1_ms or 0) + int(s1_min or 0) * 60_000
-
-            s2_ms  = _attr(lap, "m_sector2TimeMSPart",      "sector2_time_ms_part")
-            s2_min = _attr(lap, "m_sector2TimeMinutesPart", "sector2_time_minutes_part")
-            if not hasattr(lap, "m_sector2TimeMSPart") and not hasattr(lap, "sector2_time_ms_part"):
-                s2_ms = _attr(lap, "m_sector2TimeInMS", default=0); s2_min = 0
-            ps.sector2_ms = int(s2_ms or 0) + int(s2_min or 0) * 60_000
+            ps.penalty_seconds  = int(g.penalties(lap))
+            ps.num_drive_through = int(g.drive_through(lap))
+            ps.num_stop_go       = int(g.stop_go(lap))
+
+            # ── Lap and sector times (F1 24/25 split MSPart + MinutesPart)
+            if clock_moved:
+                ps.last_lap_time_ms = g.last_lap_time_ms(lap)
+                ps.best_lap_time_ms = g.best_lap_time_ms(lap)
+
+                s1_ms  = g.s1_ms(lap)
+                s1_min = g.s1_min(lap)
+                if s1_ms is None:   # pre-F1 24 layout: single InMS field
+                    s1_ms = g.s1_legacy_ms(lap); s1_min = 0
+                ps.sector1_ms = int(s1_ms or 0) + int(s1_min or 0) * 60_000
+
+                s2_ms  = g.s2_ms(lap)
+                s2_min = g.s2_min(lap)
+                if s2_ms is None:
+                    s2_ms = g.s2_legacy_ms(lap); s2_min = 0
+                ps.sector2_ms = int(s2_ms or 0) + int(s2_min or 0) * 60_000
 
             # ── Gaps (split fields)
-            raw_ahead_ms  = _attr(lap, "m_deltaToCarInFrontMSPart",   "delta_to_car_in_front_ms_part")
-            raw_ahead_min = _attr(lap, "m_deltaToCarInFrontMinutesPart", "delta_to_car_in_front_minutes_part")
+            raw_ahead_ms  = g.ahead_ms(lap)
+            raw_ahead_min = g.ahead_min(lap)
             if raw_ahead_ms is None:
-                raw_ahead_ms = _attr(lap, "m_deltaToCarInFrontInMS", default=0); raw_ahead_min = 0
+                raw_ahead_ms = g.ahead_legacy_ms(lap); raw_ahead_min = 0
             ps.prev_gap_to_ahead = ps.gap_to_ahead
             ps.gap_to_ahead = (int(raw_ahead_ms or 0) + int(raw_ahead_min or 0) * 60_000) / 1000.0
 
-            raw_behind_ms  = _attr(lap, "m_deltaToCarBehindMSPart",   "delta_to_car_behind_ms_part")
-            raw_behind_min = _attr(lap, "m_deltaToCarBehindMinutesPart", "delta_to_car_behind_minutes_part")
+            raw_behind_ms  = g.behind_ms(lap)
+            raw_behind_min = g.behind_min(lap)
             if raw_behind_ms is None:
-                raw_behind_ms = _attr(lap, "m_deltaToCarBehindInMS", default=0); raw_behind_min = 0
+                raw_behind_ms = g.behind_legacy_ms(lap); raw_behind_min = 0
             ps.gap_to_behind = (int(raw_behind_ms or 0) + int(raw_behind_min or 0) * 60_000) / 1000.0
 
-            ps.last_updated = time.time()
+            ps.last_updated = now
 
     # ──────────────────────────────────────────
     # CAR TELEMETRY  (PacketCarTelemetryData)
     # ──────────────────────────────────────────
+    @_reprobe_on_schema_change
     def _handle_car_telemetry(self, pkt: Any) -> None:
         tel_data = _attr(pkt, "m_carTelemetryData", "car_telemetry_data")
-        if tel_data is None:
+        if not tel_data:
             return
-        for car_idx, tel in enumerate(tel_data):
-            if car_idx not in self.gs.players:
+        g = self._fields(_TELEMETRY_FIELDS, tel_data[0])
+        num_cars = len(tel_data)
+        # The hottest packet (60 Hz) and only player cars are read: visit the
+        # 1-2 players directly instead of walking the whole grid
+        for ps in self.gs.active_players():
+            if ps.car_index >= num_cars:
                 continue
-            ps = self.gs.players[car_idx]
-            ps.drs_activated     = _attr(tel, "m_drs", "drs")
+            tel = tel_data[ps.car_index]
+            ps.drs_activated     = g.drs(tel)
 
-            # Speed trap: track current speed + session best
-            speed = float(_attr(tel, "m_speed", "speed", default=0))
+            # Speed trap: track current speed + best this lap
+            speed = float(g.speed(tel))
             ps.current_speed_kmh = speed
-            if speed > ps.max_speed_this_lap:
+            if speed > ps.max_speed_this_lap:   # compare first: most packets don't store
                 ps.max_speed_this_lap = speed
 
             # Tyre inner temps (m_tyresInnerTemperature or tyres_inner_temperature)
-            ti = _attr(tel, "m_tyresInnerTemperature", "tyres_inner_temperature")
+            # Mutated in place rather than allocating a TyreWear per packet
+            ti = g.tyres_inner_temp(tel)
             if ti is not None and len(ti) >= 4:
-                ps.tyre_inner_temp = TyreWear(
-                    rl=ti[0], rr=ti[1], fl=ti[2], fr=ti[3]
-                )
+                t = ps.tyre_inner_temp
+                t.rl, t.rr, t.fl, t.fr = ti[0], ti[1], ti[2], ti[3]
 
     # ──────────────────────────────────────────
     # CAR STATUS  (PacketCarStatusData)
     # ──────────────────────────────────────────
+    @_reprobe_on_schema_change
     def _handle_car_status(self, pkt: Any) -> None:
         status_data = _attr(pkt, "m_carStatusData", "car_status_data")
-        if status_data is None:
+        if not status_data:
             return
+        g = self._fields(_STATUS_FIELDS, status_data[0])
+        now = time.time()   # one timestamp for the whole snapshot
+        players = self.gs.players
         for car_idx, status in enumerate(status_data):
-            if car_idx not in self.gs.players:
+            ps = players[car_idx]
+            if ps is None:
                 continue
-            ps = self.gs.players[car_idx]
-            ps.fuel_remaining      = _attr(status, "m_fuelInTank", "fuel_in_tank", default=0.0)
-            ps.fuel_remaining_laps = _attr(status, "m_fuelRemainingLaps", "fuel_remaining_laps", default=0.0)
-            ps.fuel_mix            = _attr(status, "m_fuelMix", "fuel_mix", default=1)
-            ps.ers_store_energy    = _attr(status, "m_ersStoreEnergy", "ers_store_energy", default=0.0)
-            ps.ers_pct             = min(100.0, ps.ers_store_energy / 40_000.0)  # 4MJ max
-            ps.ers_deploy_mode     = int(_attr(status, "m_ersDeployMode", "ers_deploy_mode", default=0))
-            ps.drs_allowed         = _attr(status, "m_drsAllowed", "drs_allowed")
-            ps.tyre_compound_visual= _attr(status, "m_visualTyreCompound", "visual_tyre_compound")
-            ps.vehicle_fia_flags   = _attr(status, "m_vehicleFiaFlags", "vehicle_fia_flags", default=-1)
-            ps.last_updated        = time.time()
+            ps.fuel_remaining      = g.fuel_in_tank(status)
+            ps.fuel_remaining_laps = g.fuel_remaining_laps(status)
+            ps.fuel_mix            = g.fuel_mix(status)
+            ps.ers_store_energy    = g.ers_store_energy(status)
+            ps.ers_deploy_mode     = int(g.ers_deploy_mode(status))
+            ps.drs_allowed         = g.drs_allowed(status)
+            ps.tyre_compound_visual= g.visual_tyre_compound(status)
+            ps.vehicle_fia_flags   = g.fia_flags(status)
+            ps.last_updated        = now
 
             # Tyre age: m_tyresAgeLaps gives laps on current set directly (F1 24+)
-            raw_age = _attr(status, "m_tyresAgeLaps", "tyres_age_laps")
+            raw_age = g.tyres_age_laps(status)
             if raw_age is not None:
                 ps.tyre_age_laps = int(raw_age)
 
     # ──────────────────────────────────────────
     # CAR DAMAGE  (PacketCarDamageData)
     # ──────────────────────────────────────────
+    @_reprobe_on_schema_change
     def _handle_car_damage(self, pkt: Any) -> None:
         dmg_data = _attr(pkt, "m_carDamageData", "car_damage_data")
-        if dmg_data is None:
+        if not dmg_data:
             return
+        g = self._fields(_DAMAGE_FIELDS, dmg_data[0])
+        refresh_grid = self._damage_tick == 0
+        self._damage_tick = (self._damage_tick + 1) % _GRID_DAMAGE_EVERY
+        players  = self.gs.players
+        all_cars = self.gs.all_cars
         for car_idx, dmg in enumerate(dmg_data):
-            fl_wing = int(_attr(dmg, "m_frontLeftWingDamage",  "front_left_wing_damage"))
-            fr_wing = int(_attr(dmg, "m_frontRightWingDamage", "front_right_wing_damage"))
-            rear    = int(_attr(dmg, "m_rearWingDamage",  "rear_wing_damage"))
-            floor_d = int(_attr(dmg, "m_floorDamage",     "floor_damage"))
-            diff    = int(_attr(dmg, "m_diffuserDamage",  "diffuser_damage"))
-            pods    = int(_attr(dmg, "m_sidepodDamage",   "sidepod_damage"))
+            ps: Optional[PlayerState] = players[car_idx]
+            if ps is None and not refresh_grid:
+                continue
+            fl_wing = int(g.fl_wing(dmg))
+            fr_wing = int(g.fr_wing(dmg))
+            rear    = int(g.rear_wing(dmg))
+            floor_d = int(g.floor(dmg))
+            diff    = int(g.diffuser(dmg))
+            pods    = int(g.sidepod(dmg))
             worst   = max(fl_wing, fr_wing, rear, floor_d, diff, pods)
 
             # Update the all_cars snapshot (so nearby-damage logic can check any car)
-            if car_idx not in self.gs.all_cars:
-                self.gs.all_cars[car_idx] = CarSnapshot()
-            self.gs.all_cars[car_idx].max_damage = worst
+            all_cars[car_idx].max_damage = worst
 
             # Full damage breakdown only for player cars
-            if car_idx not in self.gs.players:
+            if ps is None:
                 continue
-            ps = self.gs.players[car_idx]
-            tw = _attr(dmg, "m_tyresWear", "tyres_wear")
+            tw = g.tyres_wear(dmg)
             if tw is not None and len(tw) >= 4:
-                vals = [float(tw[i]) for i in range(4)]
-                if all(0 <= v <= 1 for v in vals):
-                    vals = [v * 100 for v in vals]
-                ps.tyre_wear = TyreWear(rl=vals[0], rr=vals[1], fl=vals[2], fr=vals[3])
-            ps.damage = CarDamage(
-                front_wing = max(fl_wing, fr_wing),
-                rear_wing  = rear,
-                floor      = floor_d,
-                diffuser   = diff,
-                sidepods   = pods,
-            )
+                rl, rr, fl, fr = float(tw[0]), float(tw[1]), float(tw[2]), float(tw[3])
+                # Some decoders report wear as 0-1 fractions rather than percent
+                scale = 100.0 if max(rl, rr, fl, fr) <= 1.0 else 1.0
+                w = ps.tyre_wear
+                w.rl, w.rr, w.fl, w.fr = rl * scale, rr * scale, fl * scale, fr * scale
+            d = ps.damage
+            d.front_wing = max(fl_wing, fr_wing)
+            d.rear_wing  = rear
+            d.floor      = floor_d
+            d.diffuser   = diff
+            d.sidepods   = pods
 
     # ──────────────────────────────────────────
     # PARTICIPANTS  (PacketParticipantsData)
     # ──────────────────────────────────────────
+    @_reprobe_on_schema_change
     def _handle_participants(self, pkt: Any) -> None:
         participants = _attr(pkt, "m_participants", "participants")
-        if participants is None:
+        if not participants:
             return
+        g = self._fields(_PARTICIPANT_FIELDS, participants[0])
         num_active = _attr(pkt, "m_numActiveCars", "num_active_cars")
+        players = self.gs.players
         for car_idx, part in enumerate(participants):
-            if car_idx not in self.gs.players:
+            ps = players[car_idx]
+            if ps is None:
                 continue
-            ps = self.gs.players[car_idx]
             if num_active is not None:
                 ps.total_participants = int(num_active)
-            raw_name = _attr(part, "m_name", "name") or ""
+            raw_name = g.name(part) or ""
             if isinstance(raw_name, bytes):
                 raw_name = raw_name.decode("utf-8", errors="ignore")
             if raw_name.strip():
@@ -322,28 +568,29 @@ class PacketParser:
     # EVENT PACKETS  (PacketEventData) — race finish, flags etc.
     # ──────────────────────────────────────────
     def _handle_event(self, pkt: Any) -> None:
+        # Compare the raw 4-byte code — no decode/strip/upper for the many
+        # events (fastest lap, DRS, overtakes…) we don't act on
         code = _attr(pkt, "m_eventStringCode", "event_string_code", default=b"")
-        if isinstance(code, bytes):
-            code = code.decode("utf-8", errors="ignore").strip()
-        code = code.upper().rstrip("\x00")  # strip null bytes
+        if isinstance(code, str):
+            code = code.encode("ascii", errors="ignore")
+        code = code[:4]
 
-        log.debug("Event packet: %s", code)
+        log.debug("Event packet: %r", code)
 
-        if code in ("CHQF", "SEND"):
-            # CHQF = Chequered Flag, SEND = Session End
-            for ps in self.gs.players.values():
+        if code in _FINISH_EVENT_CODES:
+            for ps in self.gs.active_players():
                 ps.race_finished = True
 
 
 
-_HANDLERS: dict[str, Any] = {
-    "PacketSessionData":     PacketParser._handle_session,
-    "PacketLapData":         PacketParser._handle_lap_data,
-    "PacketCarTelemetryData":PacketParser._handle_car_telemetry,
-    "PacketCarStatusData":   PacketParser._handle_car_status,
-    "PacketCarDamageData":   PacketParser._handle_car_damage,
-    "PacketParticipantsData":PacketParser._handle_participants,
-    "PacketEventData":       PacketParser._handle_event,
+_HANDLERS: dict[int, Any] = {
+    PACKET_SESSION:       PacketParser._handle_session,
+    PACKET_LAP_DATA:      PacketParser._handle_lap_data,
+    PACKET_CAR_TELEMETRY: PacketParser._handle_car_telemetry,
+    PACKET_CAR_STATUS:    PacketParser._handle_car_status,
+    PACKET_CAR_DAMAGE:    PacketParser._handle_car_damage,
+    PACKET_PARTICIPANTS:  PacketParser._handle_participants,
+    PACKET_EVENT:         PacketParser._handle_event,
 }
 
 
@@ -1,6 +1,8 @@
 """
 telemetry/state.py
 Live race state data classes. Updated every packet cycle by the parser.
+Per-car classes use __slots__: no instance dict, and attribute stores go
+straight to a slot — they are written dozens of times per packet.
 """
 
 from __future__ import annotations
@@ -8,8 +10,11 @@ from dataclasses import dataclass, field
 from typing import Optional
 import time
 
+# Cars per session in the F1 25 UDP arrays (lap data, telemetry, damage, …)
+MAX_CARS = 22
 
-@dataclass
+
+@dataclass(slots=True)
 class TyreWear:
     fl: float = 0.0   # Front Left %
     fr: float = 0.0   # Front Right %
@@ -23,7 +28,7 @@ class TyreWear:
         return f"TyreWear(FL={self.fl:.1f}%, FR={self.fr:.1f}%, RL={self.rl:.1f}%, RR={self.rr:.1f}%)"
 
 
-@dataclass
+@dataclass(slots=True)
 class CarDamage:
     front_wing: int = 0     # 0-100 damage %
     rear_wing: int = 0
@@ -37,7 +42,7 @@ class CarDamage:
         ])
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherForecast:
     session_num: int = 0
     weather: int = 0        # 0=clear, 1=light cloud, 2=overcast, 3=light rain, 4=heavy rain, 5=storm
@@ -49,7 +54,7 @@ class WeatherForecast:
         return self.weather >= 3
 
 
-@dataclass
+@dataclass(slots=True)
 class CarSnapshot:
     """
     Lightweight state for any of the 20 cars on track.
@@ -63,7 +68,7 @@ class CarSnapshot:
     max_damage: int = 0              # 0-100: worst component damage %
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
     """All live state for one driver/player."""
     car_index: int = 0
@@ -112,7 +117,6 @@ class PlayerState:
 
     # ERS
     ers_store_energy: float = 0.0   # joules — convert to % of 4MJ
-    ers_pct: float = 0.0            # ERS store as 0-100% (4MJ = 100%)
     ers_deploy_mode: int = 0        # 0=None, 1=Medium, 2=Overtake, 3=Hotlap
     drs_allowed: int = 0            # 0=not allowed, 1=unknown, 2=allowed
     drs_activated: int = 0          # 0=off, 1=on
@@ -122,7 +126,7 @@ class PlayerState:
 
     # Weather
     weather: int = 0               # current weather code
-    weather_forecast: list[WeatherForecast] = field(default_factory=list)
+    weather_forecast: tuple[WeatherForecast, ...] = ()   # shared by all players
 
     # Pit
     pit_limiter_status: int = 0
@@ -199,23 +203,33 @@ class PlayerState:
 class GameState:
     """
     Top-level game state holding both player states and session-wide info.
-    Keyed by car_index (0 or 1 for duo career).
 
-    all_cars: snapshot of ALL 20 cars for leaderboard and nearby-damage logic.
-    Keyed by car_index (0-19).
+    players:  indexed by car_index (0-21); None for cars nobody is driving.
+              Use active_players() to iterate the registered players.
+    all_cars: snapshot of ALL cars for leaderboard and nearby-damage logic,
+              indexed by car_index (0-21). Pre-allocated and only ever
+              mutated; position 0 means the car hasn't reported yet.
+
+    Fixed-size lists rather than dicts: the parser indexes them per car per
+    packet, and a list index beats a hash probe on small contiguous ints.
     """
-    players: dict[int, PlayerState] = field(default_factory=dict)
-    all_cars: dict[int, "CarSnapshot"] = field(default_factory=dict)
+    players: list[Optional[PlayerState]] = field(default_factory=lambda: [None] * MAX_CARS)
+    all_cars: list[CarSnapshot] = field(default_factory=lambda: [CarSnapshot() for _ in range(MAX_CARS)])
     session_uid: int = 0
-    last_packet_time: float = field(default_factory=time.time)
+    last_packet_time: float = field(default_factory=time.monotonic)
 
     def get_player(self, car_index: int) -> PlayerState:
-        if car_index not in self.players:
-            self.players[car_index] = PlayerState(car_index=car_index)
-        return self.players[car_index]
+        ps = self.players[car_index]
+        if ps is None:
+            ps = self.players[car_index] = PlayerState(car_index=car_index)
+        return ps
+
+    def active_players(self) -> list[PlayerState]:
+        """Registered players in car-index order."""
+        return [p for p in self.players if p is not None]
 
     def get_player_by_discord(self, discord_id: str) -> Optional[PlayerState]:
-        for p in self.players.values():
+        for p in self.active_players():
             if p.discord_id == discord_id:
                 return p
         return None